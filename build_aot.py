@@ -0,0 +1,44 @@
+"""
+Build the Ahead-of-Time Output Validation Kernel
+
+This script compiles the score/signal-count bounds check used by
+``validate_outputs.validate_output_schemas`` into a native extension module,
+``aimm_validator``, placed next to the scripts. When that module is present,
+``validate_outputs`` imports it instead of importing Numba and JIT-compiling
+the kernel, which keeps start-up cheap for short-lived processes.
+
+The kernel itself is ``validate_outputs._bounds_kernel``; the module also
+records a checksum of it, so a build left over from an older kernel is
+detected and ignored (with a warning) until this script is re-run.
+
+The build requires Numba; the compiled module does not. Without the module,
+``validate_outputs`` falls back to the JIT kernel or to NumPy.
+
+Usage:
+    python scripts/build_aot.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from validate_outputs import _bounds_kernel, _kernel_checksum
+
+cc = CC("aimm_validator")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export("first_out_of_bounds", "i8(f8[:], i8[:])")(_bounds_kernel)
+
+# Frozen into the compiled module as a constant
+_KERNEL_CHECKSUM = _kernel_checksum()
+
+
+@cc.export("kernel_checksum", "i8()")
+def kernel_checksum():
+    """Return the checksum of the kernel this module was built from."""
+    return _KERNEL_CHECKSUM
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✓ Built aimm_validator in {cc.output_dir}")
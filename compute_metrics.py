@@ -13,10 +13,150 @@ The metrics included are:
 
 Metrics are provided for evaluation transparency only and
 do not reveal AIMM internal logic.
+
+NumPy is used when available to vectorize the computations over large
+arrays; every metric falls back to pure Python when it is not installed.
 """
 
+import warnings
+from bisect import bisect_left
 from typing import List, Tuple, Union
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba's njit, imported on first use (see _jit) because importing Numba
+# costs more than the rest of this module; False when it is not installed
+_NJIT = None
+
+# Compiled versions of the *_numba kernels below, keyed by kernel
+_JITTED = {}
+
+
+def _jit(kernel):
+    """
+    Return ``kernel`` compiled with Numba, or None if Numba is not installed.
+    
+    The ``*_numba`` functions in this module are only ever run through here.
+    """
+    global _NJIT
+    if _NJIT is None:
+        try:
+            from numba import njit
+            _NJIT = njit
+        except ImportError:
+            _NJIT = False
+    if not _NJIT:
+        return None
+    compiled = _JITTED.get(kernel)
+    if compiled is None:
+        compiled = _JITTED[kernel] = _NJIT(cache=True)(kernel)
+    return compiled
+
+
+def _confusion_numba(y_true, y_pred):
+    """Count (tp, fp, fn) in one branch-free pass over int8 labels."""
+    tp = fp = fn = 0
+    for i in range(y_true.shape[0]):
+        true_pos = y_true[i] == 1
+        pred_pos = y_pred[i] == 1
+        tp += true_pos & pred_pos
+        fp += (y_true[i] == 0) & pred_pos
+        fn += true_pos & (y_pred[i] == 0)
+    return tp, fp, fn
+
+
+def _in_unit_interval_numba(scores):
+    """
+    Check that every score lies in [0, 1] in one pass.
+    
+    Blocks are scanned without branching so the comparisons vectorize;
+    the scan stops after the first block containing a bad score.
+    """
+    n = scores.shape[0]
+    for start in range(0, n, 4096):
+        ok = True
+        for i in range(start, min(start + 4096, n)):
+            ok &= (scores[i] >= 0.0) & (scores[i] <= 1.0)
+        if not ok:
+            return False
+    return True
+
+
+# Label arrays at least this long are bit-packed before counting
+_PACKED_MIN_SIZE = 1 << 16
+
+# Below this many dates in total, NumPy's fixed per-call overhead outweighs
+# its vectorised parsing and search, so detection_delay stays in pure Python
+_NUMPY_DATES_MIN_SIZE = 128
+
+
+def _popcount(bits) -> int:
+    """Count the set bits in a packed ``uint8`` array (NumPy >= 2.0)."""
+    return int(np.bitwise_count(bits).sum())
+
+
+def _confusion(y_true: List[int], y_pred: List[int]) -> Tuple[int, int, int]:
+    """
+    Count true positives, false positives and false negatives.
+    
+    The counts are shared by precision, recall and F1 so that each metric
+    needs only a single call, and the length check runs once per metric
+    rather than once per derived quantity. With NumPy available, the labels
+    are cast once to ``int8`` arrays and counted in a single compiled pass
+    when Numba is installed, or else in vectorized C loops; long arrays
+    are then packed to bitmaps first so the counts run as popcounts.
+    
+    Parameters
+    ----------
+    y_true : List[int]
+        Ground truth binary labels (0 or 1)
+    y_pred : List[int]
+        Predicted binary labels (0 or 1)
+        
+    Returns
+    -------
+    Tuple[int, int, int]
+        The counts (tp, fp, fn)
+    """
+    assert len(y_true) == len(y_pred), "Length mismatch between y_true and y_pred"
+    
+    if np is not None:
+        yt = np.asarray(y_true, dtype=np.int8)
+        yp = np.asarray(y_pred, dtype=np.int8)
+        confusion_numba = _jit(_confusion_numba)
+        if confusion_numba is not None:
+            tp, fp, fn = confusion_numba(yt, yp)
+            return int(tp), int(fp), int(fn)
+        
+        true_pos, true_neg = yt == 1, yt == 0
+        pred_pos, pred_neg = yp == 1, yp == 0
+        count = np.count_nonzero
+        if yt.size >= _PACKED_MIN_SIZE and hasattr(np, "bitwise_count"):
+            # One bit per sample: the ANDs and popcounts touch an eighth of
+            # the memory of the boolean masks
+            true_pos, true_neg = np.packbits(true_pos), np.packbits(true_neg)
+            pred_pos, pred_neg = np.packbits(pred_pos), np.packbits(pred_neg)
+            count = _popcount
+        tp = int(count(true_pos & pred_pos))
+        fp = int(count(true_neg & pred_pos))
+        fn = int(count(true_pos & pred_neg))
+        return tp, fp, fn
+    
+    # Single pass over both label lists
+    tp = fp = fn = 0
+    for t, p in zip(y_true, y_pred):
+        if t == 1:
+            if p == 1:
+                tp += 1
+            elif p == 0:
+                fn += 1
+        elif t == 0 and p == 1:
+            fp += 1
+    return tp, fp, fn
 
 
 def precision(y_true: List[int], y_pred: List[int]) -> float:
@@ -44,10 +184,7 @@ def precision(y_true: List[int], y_pred: List[int]) -> float:
     >>> precision(y_true, y_pred)
     1.0
     """
-    assert len(y_true) == len(y_pred), "Length mismatch between y_true and y_pred"
-    
-    tp = sum(t == 1 and p == 1 for t, p in zip(y_true, y_pred))
-    fp = sum(t == 0 and p == 1 for t, p in zip(y_true, y_pred))
+    tp, fp, _ = _confusion(y_true, y_pred)
     
     if tp + fp == 0:
         return 0.0
@@ -80,10 +217,7 @@ def recall(y_true: List[int], y_pred: List[int]) -> float:
     >>> recall(y_true, y_pred)
     0.6666...
     """
-    assert len(y_true) == len(y_pred), "Length mismatch between y_true and y_pred"
-    
-    tp = sum(t == 1 and p == 1 for t, p in zip(y_true, y_pred))
-    fn = sum(t == 1 and p == 0 for t, p in zip(y_true, y_pred))
+    tp, _, fn = _confusion(y_true, y_pred)
     
     if tp + fn == 0:
         return 0.0
@@ -117,10 +251,10 @@ def f1_score(y_true: List[int], y_pred: List[int]) -> float:
     >>> f1_score(y_true, y_pred)
     0.8
     """
-    assert len(y_true) == len(y_pred), "Length mismatch between y_true and y_pred"
+    tp, fp, fn = _confusion(y_true, y_pred)
     
-    prec = precision(y_true, y_pred)
-    rec = recall(y_true, y_pred)
+    prec = tp / (tp + fp) if tp + fp else 0.0
+    rec = tp / (tp + fn) if tp + fn else 0.0
     
     if prec + rec == 0:
         return 0.0
@@ -128,6 +262,114 @@ def f1_score(y_true: List[int], y_pred: List[int]) -> float:
     return 2 * (prec * rec) / (prec + rec)
 
 
+def _rank_sum_numba(scores, labels):
+    """
+    Sum the average ranks of the positive samples in one sorted walk.
+    
+    Compiled counterpart of the NumPy tie-averaging in
+    ``_auc_mann_whitney``; avoids the temporary rank arrays.
+    """
+    order = np.argsort(scores)
+    n = scores.shape[0]
+    rank_sum = 0.0
+    start = 0
+    while start < n:
+        end = start + 1
+        while end < n and scores[order[end]] == scores[order[start]]:
+            end += 1
+        avg_rank = (start + end + 1) / 2.0
+        for k in range(start, end):
+            if labels[order[k]]:
+                rank_sum += avg_rank
+        start = end
+    return rank_sum
+
+
+def _auc_mann_whitney(y_true: List[int], y_scores: List[float]) -> float:
+    """
+    Calculate ROC AUC from the Mann-Whitney U statistic.
+    
+    Uses the rank-sum identity
+    ``AUC = (R_pos - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)``, where
+    ``R_pos`` is the sum of the ranks of the positive samples. Tied scores
+    receive their average rank, so each tied positive/negative pair counts
+    as half a concordant pair. Sorting dominates, giving O(n log n) rather
+    than a comparison of every positive/negative pair. When Numba is
+    installed the rank walk runs as compiled code.
+    
+    Parameters
+    ----------
+    y_true : List[int]
+        Ground truth binary labels (0 or 1)
+    y_scores : List[float]
+        Predicted scores or probabilities
+        
+    Returns
+    -------
+    float
+        ROC AUC score in [0, 1]. Returns 0.5 if only one class is present.
+    """
+    n = len(y_scores)
+    
+    if np is not None:
+        scores = np.asarray(y_scores, dtype=np.float64)
+        labels = np.asarray(y_true) == 1
+        n_pos = int(np.count_nonzero(labels))
+        n_neg = n - n_pos
+        if n_pos == 0 or n_neg == 0:
+            return 0.5
+        
+        rank_sum_numba = _jit(_rank_sum_numba)
+        if rank_sum_numba is not None:
+            rank_sum = float(rank_sum_numba(scores, labels))
+        else:
+            # Average the 1-based ranks over each run of tied scores
+            order = np.argsort(scores, kind="stable")
+            sorted_scores = scores[order]
+            boundaries = np.flatnonzero(np.diff(sorted_scores)) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [n]))
+            ranks = np.empty(n, dtype=np.float64)
+            ranks[order] = np.repeat((starts + ends + 1) / 2.0, ends - starts)
+            rank_sum = float(ranks[labels].sum())
+    else:
+        labels = [t == 1 for t in y_true]
+        n_pos = sum(labels)
+        n_neg = n - n_pos
+        if n_pos == 0 or n_neg == 0:
+            return 0.5
+        
+        order = sorted(range(n), key=y_scores.__getitem__)
+        rank_sum = 0.0
+        start = 0
+        while start < n:
+            end = start + 1
+            while end < n and y_scores[order[end]] == y_scores[order[start]]:
+                end += 1
+            group_pos = sum(labels[i] for i in order[start:end])
+            rank_sum += group_pos * (start + end + 1) / 2.0
+            start = end
+    
+    return (rank_sum - n_pos * (n_pos + 1) / 2.0) / (n_pos * n_neg)
+
+
+# ROC AUC backend, resolved on first use so that importing this module does
+# not pay for importing sklearn
+_ROC_AUC_IMPL = None
+
+
+def _roc_auc_impl():
+    """Return sklearn's ``roc_auc_score`` if installed, else the fallback."""
+    global _ROC_AUC_IMPL
+    if _ROC_AUC_IMPL is None:
+        try:
+            from sklearn.metrics import roc_auc_score
+            _ROC_AUC_IMPL = roc_auc_score
+        except ImportError:
+            _ROC_AUC_IMPL = _auc_mann_whitney
+    return _ROC_AUC_IMPL
+
+
 def roc_auc(y_true: List[int], y_scores: List[float]) -> float:
     """
     Calculate the area under the receiver operating characteristic curve.
@@ -137,8 +379,8 @@ def roc_auc(y_true: List[int], y_scores: List[float]) -> float:
     perfect separation; 0.5 indicates random classification.
     
     This implementation uses scipy/sklearn if available. If those libraries
-    are not installed, it provides a pure Python implementation using the
-    trapezoidal rule.
+    are not installed, it falls back to the rank-sum form of the
+    Mann-Whitney U statistic, which handles tied scores like sklearn does.
     
     Parameters
     ----------
@@ -160,33 +402,124 @@ def roc_auc(y_true: List[int], y_scores: List[float]) -> float:
     0.75
     """
     assert len(y_true) == len(y_scores), "Length mismatch between y_true and y_scores"
-    assert all(0 <= s <= 1 for s in y_scores), "y_scores must be in [0, 1]"
-    
-    try:
-        from sklearn.metrics import roc_auc_score
-        return float(roc_auc_score(y_true, y_scores))
-    except ImportError:
-        # Pure Python implementation using the Mann-Whitney U statistic
-        pos_scores = [s for t, s in zip(y_true, y_scores) if t == 1]
-        neg_scores = [s for t, s in zip(y_true, y_scores) if t == 0]
-        
-        if not pos_scores or not neg_scores:
-            return 0.5
-        
-        # Count concordant and discordant pairs
-        concordant = sum(
-            1 for pos in pos_scores for neg in neg_scores if pos > neg
-        )
-        discordant = sum(
-            1 for pos in pos_scores for neg in neg_scores if pos < neg
-        )
-        
-        total_pairs = len(pos_scores) * len(neg_scores)
-        
-        if total_pairs == 0:
-            return 0.5
-        
-        return concordant / total_pairs
+    
+    if np is not None:
+        # Cast once; the range check and the AUC computation share the array
+        y_scores = np.asarray(y_scores, dtype=np.float64)
+        in_unit_interval_numba = _jit(_in_unit_interval_numba)
+        if in_unit_interval_numba is not None:
+            in_range = in_unit_interval_numba(y_scores)
+        else:
+            in_range = y_scores.size == 0 or (
+                y_scores.min() >= 0.0 and y_scores.max() <= 1.0
+            )
+    else:
+        in_range = all(0 <= s <= 1 for s in y_scores)
+    assert in_range, "y_scores must be in [0, 1]"
+    
+    return float(_roc_auc_impl()(y_true, y_scores))
+
+
+def _delay_stats_numba(delays):
+    """Return the mean, minimum and maximum of the delays in one pass."""
+    total = 0
+    lowest = highest = delays[0]
+    for delay in delays:
+        total += delay
+        if delay < lowest:
+            lowest = delay
+        elif delay > highest:
+            highest = delay
+    return total / delays.shape[0], lowest, highest
+
+
+def _parse_date(d: Union[str, datetime]) -> datetime:
+    if isinstance(d, datetime):
+        return d
+    return datetime.fromisoformat(d)
+
+
+# Longest ISO 8601 layout handed to NumPy's parser ("D" is a digit; the
+# date/time separator may also be a space), and the prefix lengths allowed
+_ISO_TEMPLATE = "DDDD-DD-DDTDD:DD:DD.DDDDDD"
+_ISO_LENGTHS = (10, 13, 16, 19, 23, 26)
+
+# Origin and unit of datetime64[us]; NumPy converts datetime objects one
+# at a time and much more slowly than subtracting them here
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _iso_strings_to_datetime64(dates: List[str]):
+    """
+    Parse ISO 8601 date strings with NumPy's vectorized parser.
+    
+    NumPy's parser is more lenient than ``datetime.fromisoformat`` (it
+    accepts a trailing ".", for one), misreads the basic ``YYYYMMDD`` form
+    and has no time zone support. So only strings laid out exactly as a
+    prefix of ``YYYY-MM-DDTHH:MM:SS.ffffff`` (milliseconds or microseconds,
+    "T" or space separator) are handled here, and invalid values still
+    raise the same ``ValueError``. Returns None when the input needs the
+    per-element parser.
+    """
+    text = np.array(dates)
+    if text.dtype.kind != "U" or text.dtype.itemsize // 4 < 10:
+        return None
+    
+    lengths = np.char.str_len(text)
+    if not np.isin(lengths, _ISO_LENGTHS).all():
+        return None
+    
+    # Compare code points rather than one-character strings
+    codes = text.view(np.uint32).reshape(len(text), -1)
+    template = _ISO_TEMPLATE[:codes.shape[1]]
+    digit_at = np.array([c == "D" for c in template])
+    expected = np.array([ord(c) for c in template], dtype=np.uint32)
+    matches = np.where(digit_at, codes - np.uint32(ord("0")) < 10, codes == expected)
+    if codes.shape[1] > 10:
+        matches[:, 10] |= codes[:, 10] == ord(" ")
+    # Positions past the end of a string are padding
+    past_end = np.arange(codes.shape[1]) >= lengths[:, None]
+    if not (matches | past_end).all():
+        return None
+    
+    with warnings.catch_warnings():
+        # NumPy only warns about offsets such as "+05:00" or "Z"
+        warnings.simplefilter("error")
+        try:
+            parsed = text.astype("datetime64[us]")
+        except (ValueError, Warning):
+            return None
+    
+    if np.isnat(parsed).any():
+        return None
+    return parsed
+
+
+def _to_datetime64(dates: List[Union[str, datetime]]):
+    """
+    Convert ISO 8601 strings or datetimes to a ``datetime64[us]`` array.
+    
+    Lists of strings are parsed by NumPy directly when possible. Otherwise
+    each date is parsed with ``datetime.fromisoformat``; NumPy has no time
+    zone support, so aware datetimes are shifted to naive UTC first, which
+    leaves the differences between them unchanged. The number of aware
+    dates is returned too, since after the shift they can no longer be
+    told apart from naive ones.
+    """
+    if len(dates) and isinstance(dates[0], str):
+        parsed = _iso_strings_to_datetime64(dates)
+        if parsed is not None:
+            return parsed, 0
+    
+    offsets = []
+    n_aware = 0
+    for d in map(_parse_date, dates):
+        if d.utcoffset() is not None:
+            d = d.astimezone(timezone.utc).replace(tzinfo=None)
+            n_aware += 1
+        offsets.append((d - _EPOCH) // _MICROSECOND)
+    return np.array(offsets, dtype=np.int64).view("datetime64[us]"), n_aware
 
 
 def detection_delay(
@@ -224,15 +557,26 @@ def detection_delay(
     1.5
     """
     
-    def parse_date(d: Union[str, datetime]) -> datetime:
-        if isinstance(d, datetime):
-            return d
-        return datetime.fromisoformat(d)
-    
-    true_dates_parsed = [parse_date(d) for d in true_event_dates]
-    detected_dates_parsed = [parse_date(d) for d in detected_dates]
-    
-    if not true_dates_parsed:
+    use_numpy = (
+        np is not None
+        and len(true_event_dates) + len(detected_dates) >= _NUMPY_DATES_MIN_SIZE
+    )
+    if use_numpy:
+        true_dates_parsed, true_aware = _to_datetime64(true_event_dates)
+        detected_dates_parsed, detected_aware = _to_datetime64(detected_dates)
+        # Any aware/naive pair is incomparable, as in the pure-Python path
+        n_dates = len(true_dates_parsed) + len(detected_dates_parsed)
+        if (
+            len(true_dates_parsed)
+            and len(detected_dates_parsed)
+            and 0 < true_aware + detected_aware < n_dates
+        ):
+            raise TypeError("can't compare offset-naive and offset-aware datetimes")
+    else:
+        true_dates_parsed = [_parse_date(d) for d in true_event_dates]
+        detected_dates_parsed = [_parse_date(d) for d in detected_dates]
+    
+    if not len(true_dates_parsed) or not len(detected_dates_parsed):
         return {
             "mean_delay_days": 0.0,
             "max_delay_days": 0,
@@ -240,34 +584,57 @@ def detection_delay(
             "detection_rate": 0.0,
         }
     
-    # For each true event, find nearest detection
-    delays = []
-    detected_count = 0
-    
-    for true_date in true_dates_parsed:
-        if detected_dates_parsed:
-            # Find nearest detected date
+    # For each true event, find nearest detection. With the detections
+    # sorted, the nearest one is a neighbour of the search point; equally
+    # near neighbours are resolved by input order, as a linear scan would.
+    if use_numpy:
+        # return_index keeps each unique date's first input position
+        detected, first_seen = np.unique(detected_dates_parsed, return_index=True)
+        true_arr = true_dates_parsed
+        
+        idx = np.searchsorted(detected, true_arr)
+        left = np.maximum(idx - 1, 0)
+        right = np.minimum(idx, len(detected) - 1)
+        gap_left = np.abs(detected[left] - true_arr)
+        gap_right = np.abs(detected[right] - true_arr)
+        pick_left = (gap_left < gap_right) | (
+            (gap_left == gap_right) & (first_seen[left] < first_seen[right])
+        )
+        nearest = np.where(pick_left, left, right)
+        
+        # Floor division matches timedelta.days for partial days
+        delays = (detected[nearest] - true_arr) // np.timedelta64(1, "D")
+        delay_stats_numba = _jit(_delay_stats_numba)
+        if delay_stats_numba is not None:
+            mean_delay, min_delay, max_delay = delay_stats_numba(delays)
+        else:
+            mean_delay, min_delay, max_delay = delays.mean(), delays.min(), delays.max()
+        mean_delay = float(mean_delay)
+        min_delay = int(min_delay)
+        max_delay = int(max_delay)
+    else:
+        first_seen = {}
+        for i, d in enumerate(detected_dates_parsed):
+            first_seen.setdefault(d, i)
+        detected_sorted = sorted(first_seen)
+        
+        delays = []
+        for true_date in true_dates_parsed:
+            i = bisect_left(detected_sorted, true_date)
             nearest_detection = min(
-                detected_dates_parsed,
-                key=lambda x: abs((x - true_date).total_seconds()),
+                detected_sorted[max(0, i - 1):i + 1],
+                key=lambda x: (abs(x - true_date), first_seen[x]),
             )
-            delay_days = (nearest_detection - true_date).days
-            delays.append(delay_days)
-            detected_count += 1
-    
-    if not delays:
-        return {
-            "mean_delay_days": 0.0,
-            "max_delay_days": 0,
-            "min_delay_days": 0,
-            "detection_rate": 0.0,
-        }
+            delays.append((nearest_detection - true_date).days)
+        mean_delay = sum(delays) / len(delays)
+        max_delay = max(delays)
+        min_delay = min(delays)
     
     return {
-        "mean_delay_days": sum(delays) / len(delays),
-        "max_delay_days": max(delays),
-        "min_delay_days": min(delays),
-        "detection_rate": detected_count / len(true_dates_parsed),
+        "mean_delay_days": mean_delay,
+        "max_delay_days": max_delay,
+        "min_delay_days": min_delay,
+        "detection_rate": len(delays) / len(true_dates_parsed),
     }
 
 
@@ -29,10 +29,37 @@ This is a learning aid only.
 """
 
 import random
+from bisect import bisect_right
 from datetime import datetime
+from typing import Optional
+import validate_inputs
+import validate_outputs
 from validate_inputs import validate_input_schema, REQUIRED_FEATURES
 from validate_outputs import validate_output_schema
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Shared generator for the batch helpers
+_rng = np.random.default_rng() if np is not None else None
+
+# Illustrative risk bins: low < 0.33 <= medium < 0.67 <= high
+_BIN_EDGES = (0.33, 0.67)
+_BIN_LABELS = ("low", "medium", "high")
+
+# Sampling ranges for the float draws of the batch generator, in draw order:
+# reddit, twitter, stocktwits, social volume, base price, high/low/close
+# multipliers, bid-ask spread, news sentiment
+_FLOAT_LOW = (0.0, 0.0, 0.0, 0.0, 50.0, 1.0, 0.95, 0.98, 0.01, 0.0)
+_FLOAT_HIGH = (1.0, 1.0, 1.0, 1.0, 200.0, 1.05, 1.0, 1.02, 0.5, 1.0)
+
+# Inclusive integer ranges, in draw order: volume, trades count,
+# news volume, day of week
+_INT_LOW = (500000, 5000, 5, 0)
+_INT_HIGH = (5000000, 50000, 100, 6)
+
 
 def generate_random_synthetic_inputs() -> dict:
     """
@@ -81,6 +108,87 @@ def generate_random_synthetic_inputs() -> dict:
     return synthetic_sample
 
 
+def generate_random_synthetic_inputs_batch(
+    n_samples: int, seed: Optional[int] = None
+) -> dict:
+    """
+    Generate many random synthetic samples at once.
+    
+    Draws from the same ranges as ``generate_random_synthetic_inputs`` but
+    fills every feature for all samples with three vectorized NumPy draws
+    (floats, integers, booleans). The result is laid out as one array per
+    feature rather than one dictionary per sample.
+    
+    Parameters
+    ----------
+    n_samples : int
+        Number of samples to generate
+    seed : Optional[int]
+        Seed for a dedicated random generator. If omitted, draws come from
+        the module-level generator.
+        
+    Returns
+    -------
+    dict
+        A dictionary mapping each required input feature to a NumPy array
+        of length ``n_samples``.
+    """
+    if np is None:
+        raise ImportError("generate_random_synthetic_inputs_batch requires NumPy")
+    
+    rng = _rng if seed is None else np.random.default_rng(seed)
+    
+    # One row per feature keeps each feature's values contiguous
+    floats = rng.uniform(
+        np.array(_FLOAT_LOW)[:, None],
+        np.array(_FLOAT_HIGH)[:, None],
+        size=(len(_FLOAT_LOW), n_samples),
+    )
+    ints = rng.integers(
+        np.array(_INT_LOW)[:, None],
+        np.array(_INT_HIGH)[:, None],
+        size=(len(_INT_LOW), n_samples),
+        endpoint=True,
+    )
+    bools = rng.random((2, n_samples)) < 0.5
+    
+    (
+        reddit,
+        twitter,
+        stocktwits,
+        social_volume,
+        base_price,
+        high_factor,
+        low_factor,
+        close_factor,
+        spread,
+        news_sentiment,
+    ) = floats
+    volume, trades_count, news_volume, day_of_week = ints
+    high_price = base_price * high_factor
+    low_price = base_price * low_factor
+    
+    return {
+        "reddit_sentiment_score": reddit,
+        "twitter_sentiment_score": twitter,
+        "stocktwits_sentiment_score": stocktwits,
+        "social_volume_normalized": social_volume,
+        "open_price": base_price,
+        "high_price": high_price,
+        "low_price": low_price,
+        "close_price": base_price * close_factor,
+        "volume": volume,
+        "price_range": high_price - low_price,
+        "bid_ask_spread": spread,
+        "trades_count": trades_count,
+        "large_trade_indicator": bools[0],
+        "news_sentiment_score": news_sentiment,
+        "news_volume": news_volume,
+        "day_of_week": day_of_week,
+        "is_trading_day": bools[1],
+    }
+
+
 def compute_illustrative_risk_score(synthetic_inputs: dict) -> float:
     """
     Compute a fake risk score using a trivial operation.
@@ -116,6 +224,47 @@ def compute_illustrative_risk_score(synthetic_inputs: dict) -> float:
     return max(0.0, min(1.0, final_score))
 
 
+def compute_illustrative_risk_score_batch(
+    synthetic_inputs: dict, seed: Optional[int] = None
+):
+    """
+    Compute fake risk scores for a batch of samples.
+    
+    Batch counterpart of ``compute_illustrative_risk_score`` for the
+    one-array-per-feature layout returned by
+    ``generate_random_synthetic_inputs_batch``. The same four features are
+    averaged with whole-array arithmetic, noise is drawn for all samples at
+    once and the result is clipped in a single call.
+    
+    Parameters
+    ----------
+    synthetic_inputs : dict
+        Dictionary mapping feature names to NumPy arrays of equal length
+    seed : Optional[int]
+        Seed for a dedicated random generator. If omitted, noise comes from
+        the module-level generator.
+        
+    Returns
+    -------
+    numpy.ndarray
+        Array of "risk scores" in [0, 1]
+    """
+    if np is None:
+        raise ImportError("compute_illustrative_risk_score_batch requires NumPy")
+    
+    rng = _rng if seed is None else np.random.default_rng(seed)
+    
+    base_score = (
+        synthetic_inputs["reddit_sentiment_score"]
+        + synthetic_inputs["twitter_sentiment_score"]
+        + synthetic_inputs["social_volume_normalized"]
+        + synthetic_inputs["news_sentiment_score"]
+    ) / 4
+    noise = rng.uniform(-0.1, 0.1, size=base_score.shape)
+    
+    return np.clip(base_score + noise, 0.0, 1.0)
+
+
 def assign_illustrative_risk_level(risk_score: float) -> str:
     """
     Assign a risk level based on simple illustrative bins.
@@ -133,12 +282,31 @@ def assign_illustrative_risk_level(risk_score: float) -> str:
     str
         One of: "low", "medium", "high"
     """
-    if risk_score < 0.33:
-        return "low"
-    elif risk_score < 0.67:
-        return "medium"
-    else:
-        return "high"
+    return _BIN_LABELS[bisect_right(_BIN_EDGES, risk_score)]
+
+
+def assign_illustrative_risk_level_batch(risk_scores):
+    """
+    Assign illustrative risk levels to an array of scores.
+    
+    Batch counterpart of ``assign_illustrative_risk_level`` using the same
+    arbitrary bins.
+    
+    Parameters
+    ----------
+    risk_scores : numpy.ndarray
+        Scores in [0, 1]
+        
+    Returns
+    -------
+    numpy.ndarray
+        Array of strings, each one of: "low", "medium", "high"
+    """
+    if np is None:
+        raise ImportError("assign_illustrative_risk_level_batch requires NumPy")
+    
+    bins = np.searchsorted(_BIN_EDGES, risk_scores, side="right")
+    return np.array(_BIN_LABELS)[bins]
 
 
 def run_toy_demo():
@@ -250,4 +418,6 @@ def run_toy_demo():
 
 if __name__ == "__main__":
     random.seed(42)  # For reproducibility
+    validate_inputs.set_verbose(True)
+    validate_outputs.set_verbose(True)
     run_toy_demo()
@@ -9,6 +9,17 @@ Note: This script performs schema validation only. Feature engineering,
 computation, and derivation are handled elsewhere in the pipeline.
 """
 
+from types import MappingProxyType
+from typing import FrozenSet
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Print a confirmation after each successful validation (see set_verbose)
+_VERBOSE = False
+
 # Define expected input features grouped by domain
 # Social Media Features
 SOCIAL_FEATURES = {
@@ -47,15 +58,133 @@ TEMPORAL_FEATURES = {
     "is_trading_day": "bool",
 }
 
-# Consolidated required features dictionary
-REQUIRED_FEATURES = {
+# Consolidated required features dictionary (read-only, so the lookup
+# tables derived from it below cannot go stale)
+REQUIRED_FEATURES = MappingProxyType({
     **SOCIAL_FEATURES,
     **MARKET_FEATURES,
     **MICROSTRUCTURE_FEATURES,
     **NEWS_FEATURES,
     **TEMPORAL_FEATURES,
+})
+
+
+def set_verbose(verbose: bool = True) -> None:
+    """
+    Enable or disable the confirmation printed after a successful validation.
+    
+    Printing is off by default so that validation loops over many samples
+    do not spend their time on console output.
+    
+    Parameters
+    ----------
+    verbose : bool
+        Whether to print the confirmation message.
+    """
+    global _VERBOSE
+    _VERBOSE = verbose
+
+
+def _is_float(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_bool(value) -> bool:
+    return isinstance(value, bool)
+
+
+# Type checks keyed by the type names used in the feature dictionaries
+_VALIDATORS = {
+    "float": _is_float,
+    "int": _is_int,
+    "bool": _is_bool,
 }
 
+# Column dtype kinds (numpy ``dtype.kind``) accepted for each type name
+_DTYPE_KINDS = {
+    "float": "iuf",
+    "int": "iu",
+    "bool": "b",
+}
+
+# Precomputed views of REQUIRED_FEATURES for the validation hot path
+_REQUIRED_KEYS: FrozenSet[str] = frozenset(REQUIRED_FEATURES)
+_REQUIRED_ITEMS = tuple(REQUIRED_FEATURES.items())
+
+
+def _type_error(feature_name: str, expected_type: str, feature_value) -> str:
+    return (
+        f"Feature '{feature_name}' expected type {expected_type}, "
+        f"got {type(feature_value).__name__} with value {feature_value}"
+    )
+
+
+def _check_sample_generic(sample: dict) -> None:
+    """Run the input schema checks on one sample without reporting success."""
+    
+    # Check that all required features are present
+    missing_features = _REQUIRED_KEYS.difference(sample)
+    assert not missing_features, (
+        f"Missing required features: {set(missing_features)}"
+    )
+    
+    # Check that each feature has the correct type
+    for feature_name, expected_type in _REQUIRED_ITEMS:
+        is_valid = _VALIDATORS.get(expected_type)
+        if is_valid is None:
+            raise ValueError(
+                f"Unknown expected type '{expected_type}' for feature '{feature_name}'"
+            )
+        
+        feature_value = sample[feature_name]
+        assert is_valid(feature_value), (
+            _type_error(feature_name, expected_type, feature_value)
+        )
+
+
+def _compile_check_sample():
+    """
+    Generate a version of ``_check_sample_generic`` specialized to the schema.
+    
+    REQUIRED_FEATURES is fixed at import time, so the generated function
+    checks every feature in straight-line code with its name and type
+    baked in as constants: no loop over the schema, no dispatch on type
+    names, and an exact ``type(value) is ...`` test ahead of the full
+    predicate. Behaviour and error messages match the generic version.
+    """
+    lines = [
+        "def _check_sample(sample):",
+        "    missing_features = _REQUIRED_KEYS.difference(sample)",
+        "    assert not missing_features, (",
+        "        f'Missing required features: {set(missing_features)}'",
+        "    )",
+    ]
+    for feature_name, expected_type in _REQUIRED_ITEMS:
+        is_valid = _VALIDATORS.get(expected_type)
+        if is_valid is None:
+            message = (
+                f"Unknown expected type '{expected_type}' for feature '{feature_name}'"
+            )
+            lines.append(f"    raise ValueError({message!r})")
+            break
+        lines += [
+            f"    value = sample[{feature_name!r}]",
+            f"    assert type(value) is {expected_type} or {is_valid.__name__}(value), (",
+            f"        _type_error({feature_name!r}, {expected_type!r}, value)",
+            "    )",
+        ]
+    
+    namespace = {}
+    exec(compile("\n".join(lines), "<input-schema>", "exec"), globals(), namespace)
+    return namespace["_check_sample"]
+
+
+_check_sample = _compile_check_sample()
+
 
 def validate_input_schema(sample: dict) -> None:
     """
@@ -87,44 +216,78 @@ def validate_input_schema(sample: dict) -> None:
     >>> validate_input_schema(synthetic_sample)
     """
     
-    # Check that all required features are present
-    missing_features = set(REQUIRED_FEATURES.keys()) - set(sample.keys())
-    assert not missing_features, (
-        f"Missing required features: {missing_features}"
-    )
+    _check_sample(sample)
     
-    # Check that each feature has the correct type
-    for feature_name, expected_type in REQUIRED_FEATURES.items():
-        feature_value = sample[feature_name]
+    if _VERBOSE:
+        print(f"✓ Schema validation passed for sample with {len(sample)} features")
+
+
+def validate_input_schema_batch(samples) -> None:
+    """
+    Validate many samples against the AIMM input schema in one call.
+    
+    Accepts either a pandas DataFrame with one column per feature or a list
+    of sample dictionaries. For a DataFrame, a column whose plain NumPy
+    dtype already matches the expected type is accepted from its metadata
+    alone; other columns (typically ``object``, or nullable dtypes such as
+    ``Int64`` that can hold ``pd.NA``) are checked value by value.
+    
+    Parameters
+    ----------
+    samples : pandas.DataFrame or List[dict]
+        The samples to validate.
         
-        if expected_type == "float":
-            assert isinstance(feature_value, (int, float)) and not isinstance(
-                feature_value, bool
-            ), (
-                f"Feature '{feature_name}' expected type float, "
-                f"got {type(feature_value).__name__} with value {feature_value}"
-            )
-        elif expected_type == "int":
-            assert isinstance(feature_value, int) and not isinstance(
-                feature_value, bool
-            ), (
-                f"Feature '{feature_name}' expected type int, "
-                f"got {type(feature_value).__name__} with value {feature_value}"
-            )
-        elif expected_type == "bool":
-            assert isinstance(feature_value, bool), (
-                f"Feature '{feature_name}' expected type bool, "
-                f"got {type(feature_value).__name__} with value {feature_value}"
-            )
-        else:
-            raise ValueError(
-                f"Unknown expected type '{expected_type}' for feature '{feature_name}'"
-            )
+    Raises
+    ------
+    AssertionError
+        If any required feature is missing or has an incorrect type. The
+        message identifies the offending sample.
+        
+    Examples
+    --------
+    >>> validate_input_schema_batch([synthetic_sample_1, synthetic_sample_2])
+    """
+    
+    if hasattr(samples, "columns") and hasattr(samples, "dtypes"):
+        missing_features = _REQUIRED_KEYS.difference(samples.columns)
+        assert not missing_features, (
+            f"Missing required features: {set(missing_features)}"
+        )
+        
+        dtypes = samples.dtypes
+        for feature_name, expected_type in _REQUIRED_ITEMS:
+            # Only plain NumPy dtypes vouch for every value; nullable and
+            # extension dtypes (Int64, boolean, int64[pyarrow]) can hold NA
+            dtype = dtypes[feature_name]
+            if (
+                np is not None
+                and isinstance(dtype, np.dtype)
+                and dtype.kind in _DTYPE_KINDS[expected_type]
+            ):
+                continue
+            
+            is_valid = _VALIDATORS[expected_type]
+            # tolist() yields Python scalars, as to_dict("records") would
+            column = samples[feature_name]
+            for label, feature_value in zip(column.index, column.tolist()):
+                assert is_valid(feature_value), (
+                    f"Sample {label}: "
+                    f"{_type_error(feature_name, expected_type, feature_value)}"
+                )
+    else:
+        for index, sample in enumerate(samples):
+            try:
+                _check_sample(sample)
+            except AssertionError as e:
+                raise AssertionError(f"Sample {index}: {e}") from None
     
-    print(f"✓ Schema validation passed for sample with {len(sample)} features")
+    if _VERBOSE:
+        print(f"✓ Schema validation passed for {len(samples)} samples")
 
 
 if __name__ == "__main__":
+    set_verbose(True)
+    
     # Minimal synthetic sample for demonstration
     # All values are purely synthetic and do not represent real market conditions
     minimal_synthetic_sample = {
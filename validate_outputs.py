@@ -9,22 +9,300 @@ Note: This script performs schema and sanity checking only. Risk scoring logic,
 thresholding heuristics, and signal weighting are handled elsewhere in the pipeline.
 """
 
+import warnings
+import zlib
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from itertools import chain
+from typing import FrozenSet, List, NamedTuple, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Print a confirmation after each successful validation (see set_verbose)
+_VERBOSE = False
 
 # Valid risk level categories
-VALID_RISK_LEVELS = {"low", "medium", "high"}
+VALID_RISK_LEVELS: FrozenSet[str] = frozenset({"low", "medium", "high"})
+
+# Risk levels as commonly written ("low", "LOW", "Low"), so that the usual
+# casings are accepted by one set lookup without lowercasing
+_RISK_LEVEL_CASINGS: FrozenSet[str] = frozenset(
+    casing
+    for level in VALID_RISK_LEVELS
+    for casing in (level, level.upper(), level.capitalize())
+)
 
 # Common signal types that may contribute to risk assessment
 # (This is not prescriptive; actual signals depend on the model)
-COMMON_SIGNAL_TYPES = {
+COMMON_SIGNAL_TYPES: FrozenSet[str] = frozenset({
     "social_sentiment",
     "market_volatility",
     "trading_volume",
     "microstructure",
     "news_sentiment",
     "temporal_pattern",
-}
+})
+
+# Fields every output must contain, in the order they are reported
+_REQUIRED_FIELDS: Tuple[str, ...] = (
+    "risk_score",
+    "risk_level",
+    "evaluation_date",
+    "contributing_signal_types",
+)
+
+# Sorted array form of VALID_RISK_LEVELS for vectorized membership tests
+_VALID_RISK_LEVELS_ARRAY = (
+    np.array(sorted(VALID_RISK_LEVELS)) if np is not None else None
+)
+_RISK_LEVEL_CASINGS_ARRAY = (
+    np.array(sorted(_RISK_LEVEL_CASINGS)) if np is not None else None
+)
+
+
+def _bounds_kernel(scores, signal_counts):
+    """
+    Return the index of the first result whose score is outside [0, 1]
+    or that lists no signals, or -1 if there is none.
+    
+    Only ever run compiled: by Numba at run time, or ahead of time by
+    build_aot.py, which exports this same function.
+    """
+    for i in range(scores.shape[0]):
+        if not (scores[i] >= 0.0 and scores[i] <= 1.0) or signal_counts[i] <= 0:
+            return i
+    return -1
+
+
+def _kernel_checksum() -> int:
+    """Return a checksum of ``_bounds_kernel``'s bytecode and constants."""
+    code = _bounds_kernel.__code__
+    return zlib.crc32(code.co_code + repr(code.co_consts).encode())
+
+
+# Compiled bounds kernel, resolved on the first batch call so that importing
+# this module does not pay for importing Numba
+_FIRST_OUT_OF_BOUNDS = None
+
+
+def _first_out_of_bounds_impl():
+    """
+    Return the compiled bounds kernel, or False if none is available.
+    
+    Prefers the ahead-of-time build from build_aot.py, which is ignored
+    with a warning if it was built from a different kernel, then Numba's
+    JIT. Without either, callers fall back to NumPy.
+    """
+    global _FIRST_OUT_OF_BOUNDS
+    if _FIRST_OUT_OF_BOUNDS is None:
+        try:
+            import aimm_validator
+        except ImportError:
+            aimm_validator = None
+        if aimm_validator is not None and (
+            aimm_validator.kernel_checksum() != _kernel_checksum()
+        ):
+            warnings.warn(
+                "aimm_validator was built from a different bounds kernel and "
+                "is ignored; re-run build_aot.py to rebuild it"
+            )
+            aimm_validator = None
+        
+        if aimm_validator is not None:
+            _FIRST_OUT_OF_BOUNDS = aimm_validator.first_out_of_bounds
+        else:
+            try:
+                from numba import njit
+            except ImportError:
+                _FIRST_OUT_OF_BOUNDS = False
+            else:
+                _FIRST_OUT_OF_BOUNDS = njit(
+                    cache=True, error_model="numpy", boundscheck=False
+                )(_bounds_kernel)
+    return _FIRST_OUT_OF_BOUNDS
+
+
+def set_verbose(verbose: bool = True) -> None:
+    """
+    Enable or disable the confirmation printed after a successful validation.
+    
+    Printing is off by default so that validation loops over many results
+    do not spend their time on console output.
+    
+    Parameters
+    ----------
+    verbose : bool
+        Whether to print the confirmation message.
+    """
+    global _VERBOSE
+    _VERBOSE = verbose
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_iso8601(value: str) -> bool:
+    """
+    Return whether ``datetime.fromisoformat`` accepts the string.
+    
+    Results, including rejections, are cached: a batch run usually stamps
+    all of its outputs with the same evaluation date.
+    """
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+class ValidationResult(NamedTuple):
+    """
+    Outcome of validating one result against the output schema.
+    
+    Attributes
+    ----------
+    ok : bool
+        Whether the result passed every check.
+    error : str
+        Description of the first failed check; empty when ``ok`` is True.
+    """
+    
+    ok: bool
+    error: str = ""
+
+
+# Shared outcome for every passing result
+_VALID = ValidationResult(True)
+
+
+def _validate_core(result: dict) -> ValidationResult:
+    """Run the output schema checks on one result, stopping at the first failure."""
+    
+    # Check that all required fields are present. Membership is probed
+    # before any lookup, since indexing a mapping with __missing__ (such
+    # as a defaultdict) would insert the field instead of failing
+    missing_fields = [f for f in _REQUIRED_FIELDS if f not in result]
+    if missing_fields:
+        return ValidationResult(
+            False, f"Missing required fields: {missing_fields}"
+        )
+    risk_score = result["risk_score"]
+    risk_level = result["risk_level"]
+    evaluation_date = result["evaluation_date"]
+    signal_types = result["contributing_signal_types"]
+    
+    # Validate risk_score
+    if not isinstance(risk_score, (int, float)) or isinstance(risk_score, bool):
+        return ValidationResult(
+            False,
+            f"Field 'risk_score' must be numeric, got {type(risk_score).__name__}",
+        )
+    if not 0 <= risk_score <= 1:
+        return ValidationResult(
+            False, f"Field 'risk_score' must be in [0, 1], got {risk_score}"
+        )
+    
+    # Validate risk_level
+    if not isinstance(risk_level, str):
+        return ValidationResult(
+            False,
+            f"Field 'risk_level' must be a string, got {type(risk_level).__name__}",
+        )
+    # Common casings first; lowercase only for unusual ones
+    if (
+        risk_level not in _RISK_LEVEL_CASINGS
+        and risk_level.lower() not in VALID_RISK_LEVELS
+    ):
+        return ValidationResult(
+            False,
+            f"Field 'risk_level' must be one of {sorted(VALID_RISK_LEVELS)}, "
+            f"got '{risk_level}'",
+        )
+    
+    # Validate evaluation_date (ISO 8601 format check)
+    if not isinstance(evaluation_date, str):
+        return ValidationResult(
+            False,
+            f"Field 'evaluation_date' must be a string, "
+            f"got {type(evaluation_date).__name__}",
+        )
+    if not _is_valid_iso8601(evaluation_date):
+        return ValidationResult(
+            False,
+            f"Field 'evaluation_date' must be valid ISO 8601 format "
+            f"(YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS), got '{evaluation_date}'",
+        )
+    
+    # Validate contributing_signal_types
+    if not isinstance(signal_types, list):
+        return ValidationResult(
+            False,
+            f"Field 'contributing_signal_types' must be a list, "
+            f"got {type(signal_types).__name__}",
+        )
+    if not signal_types:
+        return ValidationResult(
+            False,
+            "Field 'contributing_signal_types' must contain at least one signal type",
+        )
+    for signal_type in signal_types:
+        # Exact type probe first; isinstance only for str subclasses
+        if type(signal_type) is not str and not isinstance(signal_type, str):
+            return ValidationResult(
+                False,
+                f"Each signal type must be a string, got {type(signal_type).__name__}",
+            )
+        if not signal_type:
+            return ValidationResult(False, "Signal types must be non-empty strings")
+    
+    return _VALID
+
+
+def _compile_validate():
+    """
+    Generate a fast-accept version of ``_validate_core`` specialized to the schema.
+    
+    The required field names, the accepted risk-level casings and the score
+    bounds are baked into the generated function as constants, and every
+    type is tested exactly (``type(value) is ...``), so a valid result is
+    accepted by straight-line code; only the date check and the fallback
+    are looked up as globals. Anything it does not accept outright,
+    including subclasses of the expected types, is passed to
+    ``_validate_core``, so outcomes and error messages match it.
+    """
+    risk_levels = "{" + ", ".join(map(repr, sorted(_RISK_LEVEL_CASINGS))) + "}"
+    present = " and ".join(f"{name!r} in result" for name in _REQUIRED_FIELDS)
+    lines = [
+        "def _validate(result):",
+        f"    if not ({present}):",
+        "        return _validate_core(result)",
+    ]
+    lines += [f"    {name} = result[{name!r}]" for name in _REQUIRED_FIELDS]
+    lines += [
+        "    if (",
+        "        (type(risk_score) is float or type(risk_score) is int)",
+        "        and 0 <= risk_score <= 1",
+        "        and type(risk_level) is str",
+        f"        and risk_level in {risk_levels}",
+        "        and type(evaluation_date) is str",
+        "        and _is_valid_iso8601(evaluation_date)",
+        "        and type(contributing_signal_types) is list",
+        "        and contributing_signal_types",
+        "    ):",
+        "        for signal_type in contributing_signal_types:",
+        "            if type(signal_type) is not str or not signal_type:",
+        "                return _validate_core(result)",
+        "        return _VALID",
+        "    return _validate_core(result)",
+    ]
+    
+    namespace = {}
+    exec(compile("\n".join(lines), "<output-schema>", "exec"), globals(), namespace)
+    return namespace["_validate"]
+
+
+_validate = _compile_validate()
 
 
 def validate_output_schema(result: dict) -> None:
@@ -60,76 +338,288 @@ def validate_output_schema(result: dict) -> None:
     >>> validate_output_schema(synthetic_output)
     """
     
-    required_fields = {
-        "risk_score",
-        "risk_level",
-        "evaluation_date",
-        "contributing_signal_types",
-    }
+    outcome = _validate(result)
+    if not outcome.ok:
+        raise AssertionError(outcome.error)
     
-    # Check that all required fields are present
-    missing_fields = required_fields - set(result.keys())
-    assert not missing_fields, (
-        f"Missing required fields: {missing_fields}"
-    )
+    if _VERBOSE:
+        print(
+            f"✓ Output schema validation passed for result with "
+            f"risk_score={result['risk_score']} and "
+            f"{len(result['contributing_signal_types'])} contributing signals"
+        )
+
+
+def validate_output_schema_safe(result: dict) -> ValidationResult:
+    """
+    Check a result dictionary against the AIMM output schema without raising.
     
-    # Validate risk_score
-    risk_score = result["risk_score"]
-    assert isinstance(risk_score, (int, float)) and not isinstance(
-        risk_score, bool
-    ), (
-        f"Field 'risk_score' must be numeric, got {type(risk_score).__name__}"
-    )
-    assert 0 <= risk_score <= 1, (
-        f"Field 'risk_score' must be in [0, 1], got {risk_score}"
-    )
+    Performs the same checks as ``validate_output_schema`` but reports the
+    outcome instead of raising, so that loops over many results need no
+    try/except and can collect every failure rather than stop at the first.
     
-    # Validate risk_level
-    risk_level = result["risk_level"]
-    assert isinstance(risk_level, str), (
-        f"Field 'risk_level' must be a string, got {type(risk_level).__name__}"
+    Parameters
+    ----------
+    result : dict
+        A dictionary representing a single output sample with required fields.
+        
+    Returns
+    -------
+    ValidationResult
+        ``ok`` is True if the result conforms; otherwise ``error`` holds the
+        message ``validate_output_schema`` would raise.
+        
+    Examples
+    --------
+    >>> outcomes = [validate_output_schema_safe(r) for r in results]
+    >>> errors = [o.error for o in outcomes if not o.ok]
+    """
+    return _validate(result)
+
+
+def _signal_lists_valid(signals) -> bool:
+    """Return whether every entry is a list of non-empty strings."""
+    # Exact types are screened without a Python-level loop; the generator
+    # below only runs for subclasses or invalid entries
+    if set(map(type, signals)) <= {list}:
+        signal_types = list(chain.from_iterable(signals))
+        if set(map(type, signal_types)) <= {str} and "" not in signal_types:
+            return True
+    return all(
+        isinstance(signal_types, list)
+        and all(isinstance(t, str) and t for t in signal_types)
+        for signal_types in signals
     )
-    assert risk_level.lower() in VALID_RISK_LEVELS, (
-        f"Field 'risk_level' must be one of {VALID_RISK_LEVELS}, got '{risk_level}'"
+
+
+def _within_bounds(score_array, signals) -> bool:
+    """
+    Return whether every float64 score is in [0, 1] and every result lists
+    at least one signal.
+    """
+    signal_counts = np.fromiter(map(len, signals), dtype=np.int64, count=len(signals))
+    first_out_of_bounds = _first_out_of_bounds_impl()
+    if first_out_of_bounds:
+        return first_out_of_bounds(score_array, signal_counts) < 0
+    return bool(
+        ((score_array >= 0) & (score_array <= 1)).all() and (signal_counts > 0).all()
     )
+
+
+def _results_valid(results: List[dict]) -> bool:
+    """Return whether every result passes the schema checks, column-wise."""
+    # Indexing a plain dict cannot insert a missing field, unlike a mapping
+    # with __missing__ (such as a defaultdict); leave those to the per-record
+    # checks, which probe membership first
+    if not all(type(r) is dict for r in results):
+        return False
+    try:
+        scores = [r["risk_score"] for r in results]
+        levels = [r["risk_level"] for r in results]
+        dates = [r["evaluation_date"] for r in results]
+        signals = [r["contributing_signal_types"] for r in results]
+    except KeyError:
+        return False
+    return _lists_valid(scores, levels, dates, signals)
+
+
+def _lists_valid(scores: list, levels: list, dates: list, signals) -> bool:
+    """Return whether every row passes the schema checks, given field lists."""
+    
+    # Type checks need the Python objects; bounds and categories do not.
+    # Exact int and float scores are screened without a Python-level loop
+    # (bool is neither type); the generator only runs for other types
+    if not set(map(type, scores)) <= {int, float} and not all(
+        isinstance(s, (int, float)) and not isinstance(s, bool) for s in scores
+    ):
+        return False
+    if not all(isinstance(level, str) for level in levels):
+        return False
+    
+    # Categories and dates are checked once per distinct value
+    if not all(
+        level.lower() in VALID_RISK_LEVELS
+        for level in set(levels).difference(_RISK_LEVEL_CASINGS)
+    ):
+        return False
+    
+    if not all(isinstance(d, str) for d in dates):
+        return False
+    if not all(map(_is_valid_iso8601, set(dates))):
+        return False
+    
+    if not _signal_lists_valid(signals):
+        return False
     
-    # Validate evaluation_date (ISO 8601 format check)
-    evaluation_date = result["evaluation_date"]
-    assert isinstance(evaluation_date, str), (
-        f"Field 'evaluation_date' must be a string, got {type(evaluation_date).__name__}"
-    )
     try:
-        datetime.fromisoformat(evaluation_date)
-    except ValueError:
-        raise AssertionError(
-            f"Field 'evaluation_date' must be valid ISO 8601 format "
-            f"(YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS), got '{evaluation_date}'"
+        score_array = np.fromiter(scores, dtype=np.float64, count=len(scores))
+    except OverflowError:
+        return False
+    return _within_bounds(score_array, signals)
+
+
+def validate_output_schemas(results: List[dict]) -> None:
+    """
+    Validate a batch of result dictionaries against the AIMM output schema.
+    
+    Performs the same checks as ``validate_output_schema``, column by column:
+    each field is extracted once, score bounds are checked in a single
+    NumPy pass, and risk levels and dates are checked once per distinct
+    value. If any check fails, the results are re-checked one at a time so
+    that the error reports the first invalid result with the same message
+    ``validate_output_schema`` would give.
+    
+    Parameters
+    ----------
+    results : List[dict]
+        Result dictionaries, each with the required output fields.
+        
+    Raises
+    ------
+    AssertionError
+        If any result is missing a field, has an incorrect type, or violates
+        sanity bounds. The message identifies the offending result.
+        
+    Examples
+    --------
+    >>> validate_output_schemas([synthetic_output_1, synthetic_output_2])
+    """
+    if np is None:
+        raise ImportError("validate_output_schemas requires NumPy")
+    
+    if not _results_valid(results):
+        for index, result in enumerate(results):
+            outcome = _validate(result)
+            if not outcome.ok:
+                raise AssertionError(f"Result {index}: {outcome.error}")
+    
+    if _VERBOSE:
+        print(f"✓ Output schema validation passed for {len(results)} results")
+
+
+def _column_values(column) -> list:
+    """Return the Python values of an array, Series or sequence."""
+    return column.tolist() if hasattr(column, "tolist") else list(column)
+
+
+def _columns_valid(scores, levels, dates, signals) -> bool:
+    """
+    Return whether every row of the output columns passes the schema checks.
+    
+    Arrays whose dtype settles the type check (numeric scores, string levels
+    and dates) are checked without visiting their values; any other input,
+    such as a list or an ``object`` column, is checked value by value.
+    """
+    # Plain sequences are not converted: NumPy would coerce mixed values
+    typed = all(hasattr(column, "dtype") for column in (scores, levels, dates))
+    if typed:
+        scores = np.asarray(scores)
+        levels = np.asarray(levels)
+        dates = np.asarray(dates)
+    if not (
+        typed
+        and scores.dtype.kind in "iuf"
+        and levels.dtype.kind == "U"
+        and dates.dtype.kind == "U"
+    ):
+        return _lists_valid(
+            _column_values(scores),
+            _column_values(levels),
+            _column_values(dates),
+            signals,
         )
     
-    # Validate contributing_signal_types
-    signal_types = result["contributing_signal_types"]
-    assert isinstance(signal_types, list), (
-        f"Field 'contributing_signal_types' must be a list, "
-        f"got {type(signal_types).__name__}"
-    )
-    assert len(signal_types) > 0, (
-        "Field 'contributing_signal_types' must contain at least one signal type"
+    # Common casings in one membership test; lowercase only the rest
+    unknown = ~np.isin(levels, _RISK_LEVEL_CASINGS_ARRAY)
+    if unknown.any() and not np.isin(
+        np.char.lower(levels[unknown]), _VALID_RISK_LEVELS_ARRAY
+    ).all():
+        return False
+    
+    if not all(map(_is_valid_iso8601, set(dates.tolist()))):
+        return False
+    
+    if not _signal_lists_valid(signals):
+        return False
+    
+    return _within_bounds(scores.astype(np.float64, copy=False), signals)
+
+
+def validate_output_columns(scores, levels, dates, signals) -> None:
+    """
+    Validate outputs stored column by column against the AIMM output schema.
+    
+    This is the preferred entry point for callers that already hold outputs
+    as columns, such as the columns of a pandas DataFrame or a dict of
+    arrays: no per-result dictionaries are built. A column whose dtype
+    already matches the expected type (numeric scores, string levels and
+    dates) is type-checked from its dtype alone, and bounds and categories
+    are checked with one vectorized operation per column. If any check
+    fails, or a column has another dtype (typically ``object``), the rows
+    are checked one at a time so that the error reports the first invalid
+    result with the same message ``validate_output_schema`` would give.
+    
+    Parameters
+    ----------
+    scores : array-like
+        The ``risk_score`` of each result.
+    levels : array-like
+        The ``risk_level`` of each result.
+    dates : array-like
+        The ``evaluation_date`` of each result.
+    signals : Sequence[List[str]]
+        The ``contributing_signal_types`` of each result.
+        
+    Raises
+    ------
+    AssertionError
+        If the columns differ in length, or any result has an incorrect type
+        or violates sanity bounds. The message identifies the offending
+        result.
+        
+    Examples
+    --------
+    >>> validate_output_columns(
+    ...     np.array([0.72, 0.18]),
+    ...     np.array(["medium", "low"]),
+    ...     np.array(["2025-12-28", "2025-12-27T14:30:00"]),
+    ...     [["social_sentiment"], ["market_volatility"]],
+    ... )
+    """
+    if np is None:
+        raise ImportError("validate_output_columns requires NumPy")
+    
+    assert len(scores) == len(levels) == len(dates) == len(signals), (
+        f"Output columns must have equal lengths, got {len(scores)} scores, "
+        f"{len(levels)} levels, {len(dates)} dates and {len(signals)} signal lists"
     )
-    for signal_type in signal_types:
-        assert isinstance(signal_type, str), (
-            f"Each signal type must be a string, got {type(signal_type).__name__}"
-        )
-        assert len(signal_type) > 0, (
-            "Signal types must be non-empty strings"
+    
+    if not _columns_valid(scores, levels, dates, signals):
+        rows = zip(
+            _column_values(scores),
+            _column_values(levels),
+            _column_values(dates),
+            signals,
         )
+        for index, (risk_score, risk_level, evaluation_date, signal_types) in (
+            enumerate(rows)
+        ):
+            outcome = _validate({
+                "risk_score": risk_score,
+                "risk_level": risk_level,
+                "evaluation_date": evaluation_date,
+                "contributing_signal_types": signal_types,
+            })
+            if not outcome.ok:
+                raise AssertionError(f"Result {index}: {outcome.error}")
     
-    print(
-        f"✓ Output schema validation passed for result with "
-        f"risk_score={risk_score} and {len(signal_types)} contributing signals"
-    )
+    if _VERBOSE:
+        print(f"✓ Output schema validation passed for {len(scores)} results")
 
 
 if __name__ == "__main__":
+    set_verbose(True)
+    
     # Minimal synthetic output for demonstration
     # All values are purely synthetic and do not represent real risk assessments
     synthetic_output_1 = {